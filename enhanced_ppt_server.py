@@ -6,13 +6,18 @@ Fixed version for MCP compatibility issues with English support
 """
 import os
 import json
+import base64
 import datetime
 import shutil
 import re
 import sys
+import time
 import warnings
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from functools import lru_cache
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import Optional, Dict, List, Any, NamedTuple
 
 # Suppress warnings and handle MCP import compatibility
 warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -48,8 +53,42 @@ from pptx import Presentation
 from pptx.util import Pt, Inches
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
+from pptx.text.text import TextFrame, _Run
+from pptx.oxml.ns import qn
 import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
 from copy import deepcopy
+from itertools import islice
+
+# Optional C-accelerated JSON for metadata files and Notion connector payloads
+try:
+    import orjson
+    
+    # Accepts str or bytes
+    parse_json = orjson.loads
+    
+    def dump_json_bytes(data: Any) -> bytes:
+        """Serialize data as compact UTF-8 JSON"""
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    parse_json = json.loads
+    
+    def dump_json_bytes(data: Any) -> bytes:
+        """Serialize data as compact UTF-8 JSON"""
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def write_json_file(data: Any, path: Path) -> None:
+    """Write data as compact UTF-8 JSON in one write, replacing path atomically"""
+    # Unique temp name so concurrent background writes to the same path can't interleave
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(dump_json_bytes(data))
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
 
 # Create FastMCP server with error handling
 try:
@@ -75,6 +114,28 @@ except Exception as e:
 current_presentation = None
 current_filename = None
 
+# Per-presentation caches are stored on the presentation part, so they live and
+# die with the presentation instead of pinning the previous one in a module global
+
+def slide_title_cache(presentation) -> Dict:
+    """Return the slide list titles for get_presentation_info, keyed by slide part"""
+    part = presentation.part
+    titles = getattr(part, '_slide_title_cache', None)
+    if titles is None:
+        titles = part._slide_title_cache = {}
+    return titles
+
+def slide_layout(presentation, layout_index: int):
+    """Return the slide layout at layout_index, resolving it once per presentation"""
+    part = presentation.part
+    layouts = getattr(part, '_slide_layout_cache', None)
+    if layouts is None:
+        layouts = part._slide_layout_cache = {}
+    layout = layouts.get(layout_index)
+    if layout is None:
+        layout = layouts[layout_index] = presentation.slide_layouts[layout_index]
+    return layout
+
 # ═══════════════════════════════════════════════════════════════════
 # TEMPLATE AND DIRECTORY CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════
@@ -91,84 +152,378 @@ TEMPLATE_PATHS = {
 PRESENTATIONS_DIR = Path.home() / "Desktop" / "MyPPT"
 PRESENTATIONS_DIR.mkdir(exist_ok=True)
 
+# (directory mtime_ns, entries) of the last saved-presentation listing
+_saved_listing_cache = None
+
 # Setup temp directory
 TEMP_DIR = Path(tempfile.gettempdir()) / "mcp_powerpoint"
 TEMP_DIR.mkdir(exist_ok=True)
 
-# Template registry
+def ensure_pptx_suffix(filename: str) -> str:
+    """Append the .pptx extension unless the filename already has it"""
+    return filename if filename.endswith('.pptx') else filename + '.pptx'
+
+# Buffer size for file copies (backups, shared-drive templates)
+COPY_BUFFER_SIZE = 1024 * 1024
+shutil.COPY_BUFSIZE = COPY_BUFFER_SIZE
+
+def copy_file_fast(src: Path, dst: Path) -> None:
+    """Copy a file with copy_file_range when available, else through a 1 MiB buffer"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        copied = False
+        if hasattr(os, 'copy_file_range'):
+            try:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), min(remaining, COPY_BUFFER_SIZE))
+                    if sent == 0:
+                        break
+                    remaining -= sent
+                copied = remaining == 0
+            except OSError:
+                copied = False
+            if not copied:
+                # Start over with the buffered copy
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        
+        if not copied:
+            buffer = bytearray(COPY_BUFFER_SIZE)
+            view = memoryview(buffer)
+            while True:
+                read = fsrc.readinto(buffer)
+                if not read:
+                    break
+                fdst.write(view[:read])
+    
+    shutil.copystat(src, dst)
+
+# Linux ioctl request for reflink (copy-on-write) clones
+FICLONE = 0x40049409
+
+def backup_file_fast(src: Path, dst: Path) -> None:
+    """
+    Back up a file without copying its bytes where the filesystem allows it
+    
+    Tries a hardlink, then a reflink clone (Linux), then copy_file_fast().
+    A hardlink is safe because save_presentation replaces the saved file
+    instead of rewriting it in place, so the backup is never modified.
+    The backup is built under a temporary name and swapped in, so an existing
+    dst (possibly linked to src) is never opened for writing.
+    """
+    try:
+        if os.path.samefile(src, dst):
+            # A failed save left this backup linked to the live file already
+            return
+    except FileNotFoundError:
+        pass
+    
+    fd, temp_name = tempfile.mkstemp(dir=dst.parent, prefix=f".{dst.name}.", suffix=".tmp")
+    os.close(fd)
+    temp_path = Path(temp_name)
+    try:
+        _backup_to_new_file(src, temp_path)
+        os.replace(temp_path, dst)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+def _backup_to_new_file(src: Path, dst: Path) -> None:
+    """backup_file_fast() body; dst is a fresh temporary file that nothing else refers to"""
+    try:
+        # os.link needs the name to be free
+        dst.unlink()
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    
+    if sys.platform.startswith('linux'):
+        try:
+            import fcntl
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    
+    copy_file_fast(src, dst)
+
+# Background worker for backups and metadata writes that don't need to block a save
+_io_executor = ThreadPoolExecutor(max_workers=2)
+
+def _log_background_error(future) -> None:
+    """Report a failed background write, which would otherwise go unnoticed"""
+    error = future.exception()
+    if error is not None:
+        print(f"Background write error: {error}")
+
+class TemplateInfo(NamedTuple):
+    """Registry entry for a discovered template"""
+    path: str
+    location: str
+    name: str
+    extension: str
+
+# Template registry: name -> TemplateInfo
 template_registry = {}
 
+# Supported template file extensions
+TEMPLATE_EXTENSIONS = ('.pptx', '.potx')
+
+# Time budget (seconds) for scanning all template locations
+TEMPLATE_SCAN_TIMEOUT = 2.0
+
+# Seconds before the template registry is considered stale
+TEMPLATE_REGISTRY_TTL = 30.0
+_last_template_scan = None
+# Comma-separated template names for "not found" messages, rebuilt on each scan
+available_templates_text = "None"
+
+# Directory scan cache: path -> (directory mtime_ns, [(name, path, extension), ...])
+_dir_mtime_cache = {}
+# Network locations that failed or hung once are not probed again this session
+_unreachable_template_paths = set()
+# Local scans that outlived TEMPLATE_SCAN_TIMEOUT: path -> future. They keep running
+# and seed _dir_mtime_cache, so the next refresh picks their result up
+_pending_template_scans = {}
+
+def _is_network_path(path: Path) -> bool:
+    """True for UNC paths (network shares)"""
+    return str(path).startswith(('//', '\\\\'))
+
+def _scan_template_dir(path: Path) -> List[tuple]:
+    """Scan one template directory, reusing the cached listing while its mtime is unchanged"""
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        # Missing directory or unreachable share
+        _dir_mtime_cache.pop(path, None)
+        if _is_network_path(path):
+            _unreachable_template_paths.add(path)
+        return []
+    
+    cached = _dir_mtime_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    templates = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                # Extension check first; is_file() uses the cached d_type from scandir
+                if name.lower().endswith(TEMPLATE_EXTENSIONS) and entry.is_file():
+                    template_name, extension = os.path.splitext(name)
+                    templates.append((template_name, entry.path, extension))
+    except OSError as e:
+        print(f"Error scanning template directory {path}: {e}")
+        return []
+    
+    _dir_mtime_cache[path] = (mtime, templates)
+    return templates
+
 def discover_templates():
     """Discover available PowerPoint templates from common locations"""
-    global template_registry
+    global template_registry, available_templates_text, _last_template_scan
     template_registry = {}
+    _last_template_scan = time.monotonic()
     
-    for location_name, path in TEMPLATE_PATHS.items():
-        if path.exists():
-            templates = list(path.glob("*.pptx")) + list(path.glob("*.potx"))
-            for template_path in templates:
-                template_name = template_path.stem
-                template_registry[template_name] = {
-                    'path': str(template_path),
-                    'location': location_name,
-                    'name': template_name,
-                    'extension': template_path.suffix
-                }
-    
+    # Scan all locations concurrently so a slow share doesn't serialize the rest
+    scanned = {}
+    executor = ThreadPoolExecutor(max_workers=max(1, len(TEMPLATE_PATHS)))
+    try:
+        futures = {}
+        for location_name, path in TEMPLATE_PATHS.items():
+            if path in _unreachable_template_paths:
+                continue
+            # Wait on a scan that is still running from an earlier call rather than start another
+            future = _pending_template_scans.pop(path, None)
+            if future is None:
+                future = executor.submit(_scan_template_dir, path)
+            futures[future] = location_name
+        try:
+            for future in as_completed(futures, timeout=TEMPLATE_SCAN_TIMEOUT):
+                scanned[futures[future]] = future.result()
+        except FuturesTimeoutError:
+            for future, location_name in futures.items():
+                if future.done():
+                    continue
+                path = TEMPLATE_PATHS[location_name]
+                if _is_network_path(path):
+                    _unreachable_template_paths.add(path)
+                    print(f"Template scan timed out for: {location_name} (skipped from now on)")
+                else:
+                    _pending_template_scans[path] = future
+                    print(f"Template scan timed out for: {location_name} (retried on next refresh)")
+    finally:
+        # Don't block on scans that are still hanging
+        executor.shutdown(wait=False)
+    
+    # Merge in TEMPLATE_PATHS order so later locations take precedence
+    for location_name in TEMPLATE_PATHS:
+        for template_name, template_path, extension in scanned.get(location_name, ()):
+            template_registry[template_name] = TemplateInfo(
+                path=template_path,
+                location=location_name,
+                name=template_name,
+                extension=extension
+            )
+    
+    # Keep the registry sorted by name so listings don't need to re-sort
+    template_registry = dict(sorted(template_registry.items()))
+    available_templates_text = ", ".join(template_registry) if template_registry else "None"
+    return template_registry
+
+def _ensure_templates() -> Dict:
+    """Discover templates on first use and rescan once the registry is older than the TTL"""
+    if _last_template_scan is None or time.monotonic() - _last_template_scan > TEMPLATE_REGISTRY_TTL:
+        discover_templates()
     return template_registry
 
+# Templates at least this large are loaded straight from disk rather than cached in memory
+TEMPLATE_CACHE_MAX_SIZE = 10 * 1024 * 1024
+
+@lru_cache(maxsize=8)
+def _read_template_bytes(template_path: str, mtime_ns: int) -> bytes:
+    """Read a template file once per (path, mtime); the mtime key invalidates stale entries"""
+    with open(template_path, 'rb', buffering=COPY_BUFFER_SIZE) as f:
+        return f.read()
+
 def load_template_presentation(template_name: str) -> Optional[Presentation]:
     """Load a PowerPoint template by name"""
     if template_name not in template_registry:
         return None
     
     template_info = template_registry[template_name]
-    template_path = template_info['path']
+    template_path = template_info.path
     
     try:
-        return Presentation(template_path)
+        template_stat = os.stat(template_path)
+        if template_stat.st_size >= TEMPLATE_CACHE_MAX_SIZE:
+            # Keep large templates out of the bytes cache
+            return Presentation(template_path)
+        
+        # Cache raw bytes, not Presentation objects, since presentations are mutated
+        return Presentation(BytesIO(_read_template_bytes(template_path, template_stat.st_mtime_ns)))
     except Exception as e:
         print(f"Error loading template {template_name}: {e}")
         return None
 
+# Template text box roles, in matching priority order
+_ROLE_PRIORITY = ('chapter', 'title', 'contents')
+
+# Single-pass keyword matcher for template text boxes
+# ('chap' also covers 'chapter', 'content' also covers 'contents')
+_ROLE_RE = re.compile(r'(chap|title|content)', re.IGNORECASE)
+_ROLE_KEYWORDS = {
+    'chap': 'chapter',
+    'title': 'title',
+    'content': 'contents'
+}
+
+# Fonts applied to updated template text boxes
+TEMPLATE_FONT_NAME = "Pretendard"
+CHAPTER_FONT_SIZE = Pt(18)
+TITLE_FONT_SIZE = Pt(24)
+CONTENTS_FONT_SIZE = Pt(14)
+
+def text_roles(text: str) -> set:
+    """Return every role whose keyword appears in text, in one case-insensitive scan"""
+    return {_ROLE_KEYWORDS[keyword.lower()] for keyword in _ROLE_RE.findall(text)}
+
+def classify_text_role(text: str, roles: tuple = _ROLE_PRIORITY) -> Optional[str]:
+    """Return the highest-priority role in roles whose keyword appears in text"""
+    if not text or not roles:
+        return None
+    found = text_roles(text)
+    for role in roles:
+        if role in found:
+            return role
+    return None
+
+def replace_text_with_font(text_frame, new_text: str, font_size) -> None:
+    """Replace the text of a text frame and apply the template font to its runs"""
+    paragraphs = text_frame.paragraphs
+    runs = paragraphs[0].runs if paragraphs else ()
+    if runs and '\n' not in new_text:
+        # Single line: edit the first run in place so its formatting (color, bold, ...)
+        # survives, like the zip fast path, and drop everything after it
+        first_run = runs[0]
+        first_run.text = new_text
+        p = paragraphs[0]._p
+        for element in p.xpath('./a:r | ./a:br | ./a:fld'):
+            if element is not first_run._r:
+                p.remove(element)
+        tx_body = text_frame._txBody
+        for paragraph in paragraphs[1:]:
+            tx_body.remove(paragraph._p)
+        font = first_run.font
+        font.name = TEMPLATE_FONT_NAME
+        font.size = font_size
+        return
+    
+    text_frame.text = new_text
+    # Assigning .text leaves one paragraph per line with a single run each
+    for paragraph in text_frame.paragraphs:
+        for run in paragraph.runs:
+            font = run.font
+            font.name = TEMPLATE_FONT_NAME
+            font.size = font_size
+
+def contents_preview(contents: Optional[str]) -> str:
+    """Shorten new contents text for result messages"""
+    if not contents:
+        return '(unchanged)'
+    return contents[:50] + '...' if len(contents) > 50 else contents
+
+# Text bodies of top-level slide shapes (the shapes slide.shapes would yield with a text frame)
+_SLIDE_TEXT_BODIES_XPATH = './p:cSld/p:spTree/p:sp/p:txBody'
+# Runs of those text bodies whose text contains 'Chapter'
+_CHAPTER_RUNS_XPATH = _SLIDE_TEXT_BODIES_XPATH + "/a:p/a:r[contains(a:t, 'Chapter')]"
+# Text body of the title placeholder, the one slide.shapes.title would return
+_SLIDE_TITLE_BODY_XPATH = (
+    "./p:cSld/p:spTree/p:sp[p:nvSpPr/p:nvPr/p:ph[@type='title' or @type='ctrTitle']][1]/p:txBody"
+)
+
 def update_presentation_with_smart_text(presentation: Presentation, chapter_text: str = "", 
                                       title_text: str = "", contents_text: str = "") -> Dict:
     """Smart text update for presentations"""
     modified_count = 0
+    updates = {
+        'chapter': (chapter_text, CHAPTER_FONT_SIZE),
+        'title': (title_text, TITLE_FONT_SIZE),
+        'contents': (contents_text, CONTENTS_FONT_SIZE)
+    }
+    active_roles = {role for role, (new_text, _) in updates.items() if new_text}
+    
+    if not active_roles:
+        return {
+            "status": "success",
+            "modified_count": 0,
+            "error_message": None
+        }
     
     try:
+        # Any slide's title may change below
+        slide_title_cache(presentation).clear()
+        
         for slide_idx, slide in enumerate(presentation.slides):
-            for shape in slide.shapes:
-                if not shape.has_text_frame:
+            # One XPath query per slide instead of wrapping every shape in python-pptx objects
+            for tx_body in slide.element.xpath(_SLIDE_TEXT_BODIES_XPATH):
+                current_text = _shape_xml_text(tx_body)
+                role = classify_text_role(current_text)
+                if role not in active_roles:
                     continue
-                text = shape.text_frame.text.strip().lower()
                 
-                # Chapter text update
-                if any(keyword in text for keyword in ['chapter', 'chap']):
-                    if chapter_text:
-                        shape.text_frame.text = chapter_text
-                        for paragraph in shape.text_frame.paragraphs:
-                            paragraph.font.name = "Pretendard"
-                            paragraph.font.size = Pt(18)
-                        modified_count += 1
-                
-                # Title text update
-                elif any(keyword in text for keyword in ['title']):
-                    if title_text:
-                        shape.text_frame.text = title_text
-                        for paragraph in shape.text_frame.paragraphs:
-                            paragraph.font.name = "Pretendard"
-                            paragraph.font.size = Pt(24)
-                        modified_count += 1
-                        
-                # Contents text update
-                elif any(keyword in text for keyword in ['contents', 'content']):
-                    if contents_text:
-                        shape.text_frame.text = contents_text
-                        for paragraph in shape.text_frame.paragraphs:
-                            paragraph.font.name = "Pretendard"
-                            paragraph.font.size = Pt(14)
-                        modified_count += 1
+                new_text, font_size = updates[role]
+                if current_text == new_text:
+                    # Already up to date; don't rebuild the runs
+                    continue
+                replace_text_with_font(TextFrame(tx_body, None), new_text, font_size)
+                modified_count += 1
         
         return {
             "status": "success",
@@ -182,17 +537,274 @@ def update_presentation_with_smart_text(presentation: Presentation, chapter_text
             "error_message": str(e)
         }
 
+# ═══════════════════════════════════════════════════════════════════
+# ZIP-LEVEL TEMPLATE CLONE (FAST PATH)
+# ═══════════════════════════════════════════════════════════════════
+
+# DrawingML / PresentationML element prefixes for direct slide XML edits
+_A = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+_P = '{http://schemas.openxmlformats.org/presentationml/2006/main}'
+
+# Slide parts inside a .pptx package
+_SLIDE_PART_RE = re.compile(r'^ppt/slides/slide\d+\.xml$')
+
+# Case-insensitive keyword pre-filter for raw slide XML (no lowercase copy needed)
+_ROLE_BYTES_RE = re.compile(rb'chap|title|content', re.IGNORECASE)
+
+# Run properties that must follow <a:latin> inside <a:rPr>
+_RPR_AFTER_LATIN = {_A + tag for tag in ('ea', 'cs', 'sym', 'hlinkClick', 'hlinkMouseOver', 'rtl', 'extLst')}
+
+# Main part content types (a .potx clone must become a .pptx)
+_TEMPLATE_MAIN_CONTENT_TYPE = b'presentationml.template.main+xml'
+_PRESENTATION_MAIN_CONTENT_TYPE = b'presentationml.presentation.main+xml'
+
+# Prefixed namespace declarations in a raw XML part
+_XMLNS_RE = re.compile(rb'xmlns:([A-Za-z_][\w.-]*)="([^"]*)"')
+
+def _parse_xml_part(data: bytes) -> tuple:
+    """Parse an XML part with ElementTree, keeping its namespace prefixes"""
+    namespaces = {}
+    for prefix, uri in _XMLNS_RE.findall(data):
+        prefix = prefix.decode('ascii')
+        uri = uri.decode('utf-8')
+        namespaces[prefix] = uri
+        try:
+            ET.register_namespace(prefix, uri)
+        except ValueError:
+            pass
+    return ET.fromstring(data), namespaces
+
+def _serialize_xml_part(root, namespaces: Dict[str, str]) -> bytes:
+    """
+    Serialize an ElementTree root, restoring namespace declarations ET dropped
+    
+    ElementTree only declares namespaces that are used by element or attribute
+    names, but mc:Ignorable / mc:Choice reference prefixes by value.
+    """
+    data = ET.tostring(root, encoding='UTF-8', xml_declaration=True)
+    tag_start = data.index(b'<', data.index(b'?>') + 2)
+    tag_end = data.index(b'>', tag_start)
+    if data[tag_end - 1:tag_end] == b'/':
+        tag_end -= 1
+    declared = {prefix.decode('ascii') for prefix, _ in _XMLNS_RE.findall(data[tag_start:tag_end])}
+    missing = ''.join(
+        f' xmlns:{prefix}="{uri}"' for prefix, uri in namespaces.items() if prefix not in declared
+    ).encode('utf-8')
+    return data[:tag_end] + missing + data[tag_end:]
+
+def _shape_xml_text(tx_body) -> str:
+    """Return the text of a <p:txBody>, one line per paragraph"""
+    return '\n'.join(
+        ''.join(t.text or '' for t in paragraph.iter(_A + 't'))
+        for paragraph in tx_body.iterfind(_A + 'p')
+    )
+
+def _apply_xml_font(run_properties, font_size) -> None:
+    """Set the template font name and size on an <a:rPr> element"""
+    run_properties.set('sz', str(int(font_size.pt * 100)))
+    latin = run_properties.find(_A + 'latin')
+    if latin is None:
+        latin = run_properties.makeelement(_A + 'latin', {})
+        successors = [i for i, child in enumerate(run_properties) if child.tag in _RPR_AFTER_LATIN]
+        run_properties.insert(successors[0] if successors else len(run_properties), latin)
+    latin.set('typeface', TEMPLATE_FONT_NAME)
+
+def _replace_xml_text(tx_body, new_text: str, font_size) -> None:
+    """Replace the text of a <p:txBody>, keeping the first run's formatting"""
+    paragraphs = tx_body.findall(_A + 'p')
+    first = paragraphs[0]
+    for paragraph in paragraphs[1:]:
+        tx_body.remove(paragraph)
+    
+    template_run = first.find(_A + 'r')
+    template_props = template_run.find(_A + 'rPr') if template_run is not None else None
+    for child in list(first):
+        if child.tag in (_A + 'r', _A + 'br', _A + 'fld'):
+            first.remove(child)
+    
+    # One paragraph per line, matching python-pptx's text_frame.text setter
+    lines = new_text.split('\n')
+    blank = deepcopy(first)
+    insert_at = list(tx_body).index(first) + 1
+    for line_idx, line in enumerate(lines):
+        if line_idx == 0:
+            paragraph = first
+        else:
+            paragraph = deepcopy(blank)
+            tx_body.insert(insert_at, paragraph)
+            insert_at += 1
+        
+        run = paragraph.makeelement(_A + 'r', {})
+        if template_props is not None:
+            run_properties = deepcopy(template_props)
+        else:
+            run_properties = run.makeelement(_A + 'rPr', {'lang': 'en-US'})
+        _apply_xml_font(run_properties, font_size)
+        run.append(run_properties)
+        text_element = run.makeelement(_A + 't', {})
+        text_element.text = line
+        run.append(text_element)
+        
+        end_props = paragraph.find(_A + 'endParaRPr')
+        paragraph.insert(list(paragraph).index(end_props) if end_props is not None else len(paragraph), run)
+
+def _update_slide_xml(data: bytes, updates: Dict[str, tuple]) -> Optional[bytes]:
+    """Apply role-based text updates to one slide part; None if nothing changed"""
+    root, namespaces = _parse_xml_part(data)
+    modified = 0
+    # Top-level shapes only, the same ones _SLIDE_TEXT_BODIES_XPATH selects for
+    # clone_template_and_update (no group shapes or AlternateContent fallbacks)
+    for shape in root.iterfind(f'{_P}cSld/{_P}spTree/{_P}sp'):
+        tx_body = shape.find(_P + 'txBody')
+        if tx_body is None or tx_body.find(_A + 'p') is None:
+            continue
+        role = classify_text_role(_shape_xml_text(tx_body))
+        if role not in updates:
+            continue
+        new_text, font_size = updates[role]
+        _replace_xml_text(tx_body, new_text, font_size)
+        modified += 1
+    
+    if not modified:
+        return None
+    return _serialize_xml_part(root, namespaces)
+
+def fast_clone_and_update(template_path: str, dst_path: Path, chapter_text: str = "",
+                          title_text: str = "", contents_text: str = "") -> Dict:
+    """
+    Clone a template .pptx/.potx to dst_path, rewriting only slide parts that change
+    
+    Every other package part is copied byte-for-byte, so python-pptx never
+    parses the masters, layouts or untouched slides.
+    """
+    updates = {
+        role: (new_text, font_size)
+        for role, new_text, font_size in (
+            ('chapter', chapter_text, CHAPTER_FONT_SIZE),
+            ('title', title_text, TITLE_FONT_SIZE),
+            ('contents', contents_text, CONTENTS_FONT_SIZE)
+        )
+        if new_text
+    }
+    modified_parts = 0
+    slide_count = 0
+    temp_path = dst_path.with_name(f".{dst_path.name}.tmp")
+    
+    try:
+        with zipfile.ZipFile(template_path) as zin, \
+             zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED) as zout:
+            for info in zin.infolist():
+                data = zin.read(info.filename)
+                
+                if info.filename == '[Content_Types].xml':
+                    data = data.replace(_TEMPLATE_MAIN_CONTENT_TYPE, _PRESENTATION_MAIN_CONTENT_TYPE)
+                elif _SLIDE_PART_RE.match(info.filename):
+                    slide_count += 1
+                    if updates and _ROLE_BYTES_RE.search(data):
+                        updated = _update_slide_xml(data, updates)
+                        if updated is not None:
+                            data = updated
+                            modified_parts += 1
+                
+                zout.writestr(info, data)
+        
+        os.replace(temp_path, dst_path)
+        return {
+            "status": "success",
+            "modified_count": modified_parts,
+            "slide_count": slide_count,
+            "error_message": None
+        }
+    except Exception as e:
+        # After a successful os.replace there is nothing left to clean up
+        temp_path.unlink(missing_ok=True)
+        return {
+            "status": "failure",
+            "modified_count": 0,
+            "slide_count": 0,
+            "error_message": str(e)
+        }
+
 # ═══════════════════════════════════════════════════════════════════
 # NOTION INTEGRATION HELPER FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════
 
+# Notion page patterns, compiled once (all support both Korean and English)
+# Section bodies run up to the next '##' heading; the unrolled [^#]*(?:#(?!#)[^#]*)*
+# form consumes the body in one linear pass instead of a lazy .*? with a
+# lookahead tried at every character
+_BASIC_SECTION_RE = re.compile(r'## 🔧 (Basic Settings|기본 설정)([^#]*(?:#(?!#)[^#]*)*)')
+_STYLE_SECTION_RE = re.compile(r'## 🎨 (Style Guide|스타일 가이드)([^#]*(?:#(?!#)[^#]*)*)')
+_SLIDE_DB_RE = re.compile(r'(Slide Configuration|슬라이드 구성).*?https://www\.notion\.so/([a-f0-9]+)')
+_TABLE_DB_RE = re.compile(r'(Table Data|표 데이터).*?https://www\.notion\.so/([a-f0-9]+)')
+
+# Combined field patterns: one scan per block, the named group that matched
+# (match.lastgroup) is the setting key. Values stay on their own line so a
+# field without a value can't consume the next field's line
+_BASIC_FIELDS_RE = re.compile(
+    r'\*\*(?:Project Name|프로젝트명):\*\* (?P<project_name>.+)'
+    r'|\*\*(?:Template|템플릿):\*\* (?P<template>.+)'
+    r'|\*\*(?:Font|폰트)\*\*?[ \t]*[:：][ \t]*(?P<font>.+)'
+    r'|\*\*(?:Diagram Type|다이어그램 타입):\*\* (?P<diagram_type>.+)'
+    r'|\*\*(?:Total Slides|총 슬라이드 수):\*\* (?P<total_slides>\d+)'
+)
+
+_COLOR_FIELDS_RE = re.compile(
+    r'\*\*(?:Main Color|메인 컬러):\*\* (?P<main>#[A-Fa-f0-9]{6})'
+    r'|\*\*(?:Accent Color|강조 컬러):\*\* (?P<accent>#[A-Fa-f0-9]{6})'
+    r'|\*\*(?:Background Color|배경 컬러):\*\* (?P<background>#[A-Fa-f0-9]{6})'
+)
+
+_FONT_FIELDS_RE = re.compile(
+    r'\*\*(?:Title|제목):\*\* [^,\n]*,?[ \t]*(?P<title>\d+)pt'
+    r'|\*\*(?:Body|본문):\*\* [^,\n]*,?[ \t]*(?P<body>\d+)pt'
+    r'|\*\*(?:Caption|캡션):\*\* [^,\n]*,?[ \t]*(?P<caption>\d+)pt'
+)
+
+# Default style guide layout
+DEFAULT_MARGIN = Inches(2/2.54)
+DEFAULT_SPACING = Inches(1/2.54)
+
+# Table placement and colors for inserted Notion tables
+TABLE_DEFAULT_LEFT = Inches(1)
+TABLE_TOP = Inches(3.5)  # Below title and contents
+TABLE_WIDTH = Inches(8)
+TABLE_ROW_HEIGHT = Inches(0.5)
+DEFAULT_SLIDE_WIDTH = Inches(10)
+WHITE = RGBColor(255, 255, 255)
+BLACK = RGBColor(0, 0, 0)
+
+_FONT_BOLD_PATTERNS = {
+    key: re.compile(rf'\*\*{key}:\*\* (Bold|굵게)') for key in ('title', 'body', 'caption')
+}
+
+# Connector results are reused for this long, so tools called back-to-back
+# on the same page share one round trip
+NOTION_CACHE_TTL = 300.0
+_notion_cache = {}
+
+def _cached_notion_call(key: tuple, fetch):
+    """Return fetch() through the Notion TTL cache; empty results are not cached"""
+    now = time.monotonic()
+    cached = _notion_cache.get(key)
+    if cached and now - cached[0] < NOTION_CACHE_TTL:
+        return cached[1]
+    
+    result = fetch()
+    if result:
+        _notion_cache[key] = (now, result)
+    return result
+
 def fetch_notion_page(notion_url: str) -> Dict[str, Any]:
     """
     Fetch complete Notion page content
     Actually calls Notion:fetch connector function
     """
+    return _cached_notion_call(('page', notion_url), lambda: _fetch_notion_page_uncached(notion_url))
+
+def _fetch_notion_page_uncached(notion_url: str) -> Dict[str, Any]:
     # TODO: Use Notion connector in actual implementation
-    # return Notion.fetch(notion_url)
+    # return Notion.fetch(notion_url)  (decode raw JSON responses with parse_json)
     return {}
 
 def search_notion_database(query: str, database_url: str = None) -> List[Dict[str, Any]]:
@@ -200,6 +812,12 @@ def search_notion_database(query: str, database_url: str = None) -> List[Dict[st
     Search Notion database
     Actually calls Notion:search connector function
     """
+    return _cached_notion_call(
+        ('search', query, database_url),
+        lambda: _search_notion_database_uncached(query, database_url)
+    )
+
+def _search_notion_database_uncached(query: str, database_url: str = None) -> List[Dict[str, Any]]:
     # TODO: Use Notion connector in actual implementation
     # return Notion.search(query, database_url)
     return []
@@ -218,29 +836,20 @@ def extract_basic_settings(notion_content: str) -> Dict[str, Any]:
     settings = {}
     
     # Find basic settings section (supports both Korean and English)
-    basic_section = re.search(r'## 🔧 (Basic Settings|기본 설정)(.*?)(?=##|$)', notion_content, re.DOTALL)
+    basic_section = _BASIC_SECTION_RE.search(notion_content)
     if not basic_section:
         return {}
     
     content = basic_section.group(2)
     
-    # Parse each setting item (supports both Korean and English)
-    patterns = {
-        'project_name': r'\*\*(Project Name|프로젝트명):\*\* (.+)',
-        'template': r'\*\*(Template|템플릿):\*\* (.+)',
-        'font': r'\*\*(Font|폰트)\*\*?\s*[:：]\s*(.+)',
-        'diagram_type': r'\*\*(Diagram Type|다이어그램 타입):\*\* (.+)',
-        'total_slides': r'\*\*(Total Slides|총 슬라이드 수):\*\* (\d+)'
-    }
+    # Parse all setting items in one pass (supports both Korean and English)
+    for match in _BASIC_FIELDS_RE.finditer(content):
+        key = match.lastgroup
+        if key not in settings:  # First occurrence wins
+            settings[key] = match.group(key).strip()
     
-    for key, pattern in patterns.items():
-        match = re.search(pattern, content)
-        if match:
-            value = match.group(match.lastindex).strip()  # Get the last group (actual value)
-            if key == 'total_slides':
-                settings[key] = int(value)
-            else:
-                settings[key] = value
+    if 'total_slides' in settings:
+        settings['total_slides'] = int(settings['total_slides'])
     
     return settings
 
@@ -252,13 +861,19 @@ def extract_slide_configurations(notion_url: str) -> List[Dict[str, Any]]:
     | Slide | Chapter | Title | Contents | Layout_Type | Special_Requirements |
     """
     try:
-        page_content = fetch_notion_page(notion_url)
+        return extract_slide_configurations_from_content(fetch_notion_page(notion_url))
+    except Exception as e:
+        print(f"Slide configuration extraction error: {e}")
+        return []
+
+def extract_slide_configurations_from_content(page_content: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract slide configurations from an already fetched Notion page"""
+    try:
         if not page_content:
             return []
         
         # Extract slide configuration database URL (supports Korean and English)
-        db_pattern = r'(Slide Configuration|슬라이드 구성).*?https://www\.notion\.so/([a-f0-9]+)'
-        db_match = re.search(db_pattern, page_content.get('text', ''))
+        db_match = _SLIDE_DB_RE.search(page_content.get('text', ''))
         
         if db_match:
             db_id = db_match.group(2)
@@ -279,13 +894,19 @@ def extract_table_data(notion_url: str) -> List[Dict[str, Any]]:
     | Table_ID | Parent_Slide | Row | Column | Cell_Value | Header_Type |
     """
     try:
-        page_content = fetch_notion_page(notion_url)
+        return extract_table_data_from_content(fetch_notion_page(notion_url))
+    except Exception as e:
+        print(f"Table data extraction error: {e}")
+        return []
+
+def extract_table_data_from_content(page_content: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract table data entries from an already fetched Notion page"""
+    try:
         if not page_content:
             return []
         
         # Extract table data database URL (supports Korean and English)
-        db_pattern = r'(Table Data|표 데이터).*?https://www\.notion\.so/([a-f0-9]+)'
-        db_match = re.search(db_pattern, page_content.get('text', ''))
+        db_match = _TABLE_DB_RE.search(page_content.get('text', ''))
         
         if db_match:
             db_id = db_match.group(2)
@@ -301,14 +922,21 @@ def extract_table_data(notion_url: str) -> List[Dict[str, Any]]:
 def extract_style_guide(notion_url: str) -> Dict[str, Any]:
     """Extract style guide from Notion page"""
     try:
-        page_content = fetch_notion_page(notion_url)
+        return extract_style_guide_from_content(fetch_notion_page(notion_url))
+    except Exception as e:
+        print(f"Style guide extraction error: {e}")
+        return get_default_style_guide()
+
+def extract_style_guide_from_content(page_content: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract style guide from an already fetched Notion page"""
+    try:
         if not page_content:
             return get_default_style_guide()
         
         content_text = page_content.get('text', '')
         
         # Find style guide section (supports Korean and English)
-        style_section = re.search(r'## 🎨 (Style Guide|스타일 가이드)(.*?)(?=##|$)', content_text, re.DOTALL)
+        style_section = _STYLE_SECTION_RE.search(content_text)
         if not style_section:
             return get_default_style_guide()
         
@@ -332,8 +960,8 @@ def get_default_style_guide() -> Dict[str, Any]:
             'caption': {'size': 12, 'bold': False}
         },
         'layout': {
-            'margin': Inches(2/2.54),
-            'spacing': Inches(1/2.54)
+            'margin': DEFAULT_MARGIN,
+            'spacing': DEFAULT_SPACING
         }
     }
 
@@ -342,57 +970,51 @@ def parse_style_guide_content(content: str) -> Dict[str, Any]:
     style_guide = get_default_style_guide()
     
     # Parse color palette (supports both Korean and English)
-    color_patterns = {
-        'main': r'\*\*(Main Color|메인 컬러):\*\* (#[A-Fa-f0-9]{6})',
-        'accent': r'\*\*(Accent Color|강조 컬러):\*\* (#[A-Fa-f0-9]{6})',
-        'background': r'\*\*(Background Color|배경 컬러):\*\* (#[A-Fa-f0-9]{6})'
-    }
-    
-    for key, pattern in color_patterns.items():
-        match = re.search(pattern, content)
-        if match:
-            style_guide['colors'][key] = match.group(2)  # Get the color value
+    found_colors = set()
+    for match in _COLOR_FIELDS_RE.finditer(content):
+        key = match.lastgroup
+        if key not in found_colors:  # First occurrence wins
+            found_colors.add(key)
+            style_guide['colors'][key] = match.group(key)
     
     # Parse font settings (supports Korean and English)
-    font_patterns = {
-        'title': r'\*\*(Title|제목):\*\* [^,]*,?\s*(\d+)pt',
-        'body': r'\*\*(Body|본문):\*\* [^,]*,?\s*(\d+)pt',
-        'caption': r'\*\*(Caption|캡션):\*\* [^,]*,?\s*(\d+)pt'
-    }
-    
-    for key, pattern in font_patterns.items():
-        match = re.search(pattern, content)
-        if match:
-            style_guide['fonts'][key]['size'] = int(match.group(2))
+    found_fonts = set()
+    for match in _FONT_FIELDS_RE.finditer(content):
+        key = match.lastgroup
+        if key not in found_fonts:
+            found_fonts.add(key)
+            style_guide['fonts'][key]['size'] = int(match.group(key))
             # Check for bold (supports Korean and English)
-            bold_check = re.search(rf'\*\*{key}:\*\* (Bold|굵게)', content)
+            bold_check = _FONT_BOLD_PATTERNS[key].search(content)
             style_guide['fonts'][key]['bold'] = bool(bold_check)
     
     return style_guide
 
+@lru_cache(maxsize=128)
 def parse_notion_color(color_str: str) -> RGBColor:
     """Convert Notion color string to RGBColor"""
-    if color_str.startswith('#'):
-        color_str = color_str[1:]
+    hex_str = color_str[1:] if color_str.startswith('#') else color_str
+    if len(hex_str) != 6:
+        raise ValueError(f"Invalid color: {color_str!r}")
+    value = int(hex_str, 16)
     
-    r = int(color_str[0:2], 16)
-    g = int(color_str[2:4], 16) 
-    b = int(color_str[4:6], 16)
-    
-    return RGBColor(r, g, b)
+    return RGBColor((value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff)
 
 def organize_table_data(table_entries: List[Dict]) -> Dict[str, Dict]:
     """Organize table data by slides"""
+    # Group on (slide, table) tuples; string keys are built once per table at the end
     tables_by_slide = {}
     
     for entry in table_entries:
-        parent_slide = entry.get('Parent_Slide', '1')
-        table_id = entry.get('Table_ID', 'DEFAULT')
-        
-        key = f"slide_{parent_slide}_{table_id}"
-        
-        if key not in tables_by_slide:
-            tables_by_slide[key] = {
+        get = entry.get
+        parent_slide = get('Parent_Slide', '1')
+        table_id = get('Table_ID', 'DEFAULT')
+        row = int(get('Row', 1))
+        col = int(get('Column', 1))
+        
+        table = tables_by_slide.get((parent_slide, table_id))
+        if table is None:
+            table = tables_by_slide[(parent_slide, table_id)] = {
                 'slide_number': parent_slide,
                 'table_id': table_id,
                 'cells': [],
@@ -400,20 +1022,55 @@ def organize_table_data(table_entries: List[Dict]) -> Dict[str, Dict]:
                 'max_col': 0
             }
         
-        row = int(entry.get('Row', 1))
-        col = int(entry.get('Column', 1))
+        if row > table['max_row']:
+            table['max_row'] = row
+        if col > table['max_col']:
+            table['max_col'] = col
         
-        tables_by_slide[key]['max_row'] = max(tables_by_slide[key]['max_row'], row)
-        tables_by_slide[key]['max_col'] = max(tables_by_slide[key]['max_col'], col)
-        
-        tables_by_slide[key]['cells'].append({
+        table['cells'].append({
             'row': row,
             'col': col,
-            'value': entry.get('Cell_Value', ''),
-            'is_header': entry.get('Header_Type') == 'column_header'
+            'value': get('Cell_Value', ''),
+            'is_header': get('Header_Type') == 'column_header'
         })
     
-    return tables_by_slide
+    return {
+        f"slide_{parent_slide}_{table_id}": table
+        for (parent_slide, table_id), table in tables_by_slide.items()
+    }
+
+# Per-URL lookup indexes, rebuilt whenever the cached connector result changes
+_slide_config_indexes = {}
+_table_data_indexes = {}
+
+def slide_config_index(notion_url: str) -> Dict[int, Dict]:
+    """Map slide number to its configuration entry (first entry wins)"""
+    slide_configs = extract_slide_configurations(notion_url)
+    cached = _slide_config_indexes.get(notion_url)
+    if cached and cached[0] is slide_configs:
+        return cached[1]
+    
+    index = {}
+    for config in slide_configs:
+        try:
+            index.setdefault(int(config.get('Slide', 0)), config)
+        except (TypeError, ValueError):
+            continue
+    _slide_config_indexes[notion_url] = (slide_configs, index)
+    return index
+
+def table_data_index(notion_url: str) -> Dict[str, List[Dict]]:
+    """Group table data entries by their Parent_Slide value"""
+    table_data = extract_table_data(notion_url)
+    cached = _table_data_indexes.get(notion_url)
+    if cached and cached[0] is table_data:
+        return cached[1]
+    
+    index = {}
+    for item in table_data:
+        index.setdefault(item.get('Parent_Slide'), []).append(item)
+    _table_data_indexes[notion_url] = (table_data, index)
+    return index
 
 # ═══════════════════════════════════════════════════════════════════
 # TEMPLATE DISCOVERY AND MANAGEMENT TOOLS
@@ -433,17 +1090,14 @@ def scan_templates() -> str:
         
         # Group by location
         by_location = {}
-        for template_name, info in templates.items():
-            location = info['location']
-            if location not in by_location:
-                by_location[location] = []
-            by_location[location].append(info)
-        
-        for location, template_list in by_location.items():
-            result.append(f"{location.replace('_', ' ').title()}:")
-            for template in template_list:
-                result.append(f"   {template['name']}{template['extension']}")
-            result.append("")
+        for info in templates.values():
+            by_location.setdefault(info.location, []).append(f"   {info.name}{info.extension}\n")
+        
+        # One block per location, followed by a blank line
+        result.extend(
+            f"{location.replace('_', ' ').title()}:\n{''.join(lines)}"
+            for location, lines in by_location.items()
+        )
         
         return "\n".join(result)
         
@@ -453,19 +1107,17 @@ def scan_templates() -> str:
 @mcp.tool()
 def list_available_templates() -> str:
     """List all currently available templates"""
-    if not template_registry:
-        discover_templates()
+    _ensure_templates()
     
     if not template_registry:
         return "No templates available. Run 'scan_templates' first."
     
     result = [f"Available templates ({len(template_registry)}):\n"]
-    
-    for template_name, info in sorted(template_registry.items()):
-        result.append(f"{template_name}")
-        result.append(f"   Location: {info['location']}")
-        result.append(f"   Path: {info['path']}")
-        result.append("")
+    # One formatted block per template, followed by a blank line
+    result.extend(
+        f"{template_name}\n   Location: {info.location}\n   Path: {info.path}\n"
+        for template_name, info in template_registry.items()
+    )
     
     return "\n".join(result)
 
@@ -473,6 +1125,49 @@ def list_available_templates() -> str:
 # SLIDE DUPLICATION TOOLS
 # ═══════════════════════════════════════════════════════════════════
 
+def copy_shape_elements(shape_elements, target_sp_tree) -> int:
+    """
+    Clone shape_elements into target_sp_tree in one splice
+    
+    lxml's __copy__ is already a C-level deep subtree clone, so it is called
+    directly instead of copy.deepcopy; the clones are inserted before
+    <p:extLst> with a single slice assignment rather than one insert per shape.
+    """
+    clones = [element.__copy__() for element in shape_elements]
+    ext_lst = target_sp_tree.find(qn('p:extLst'))
+    index = target_sp_tree.index(ext_lst) if ext_lst is not None else len(target_sp_tree)
+    target_sp_tree[index:index] = clones
+    return len(clones)
+
+def update_duplicated_slide_text(slide, new_title: str, new_content: str, new_chapter: str) -> int:
+    """Replace chapter/title/content text on a duplicated slide, returning the number of updated shapes"""
+    updated_elements = 0
+    
+    for shape in slide.shapes:
+        if not shape.has_text_frame:
+            continue
+            
+        text_frame = shape.text_frame
+        text = text_frame.text
+        roles = text_roles(text)
+        
+        # Update chapter
+        if new_chapter and 'chapter' in roles:
+            replace_text_with_font(text_frame, new_chapter, CHAPTER_FONT_SIZE)
+            updated_elements += 1
+            
+        # Update title
+        elif new_title and ('title' in roles or len(text) < 50):
+            replace_text_with_font(text_frame, new_title, TITLE_FONT_SIZE)
+            updated_elements += 1
+            
+        # Update content
+        elif new_content and ('contents' in roles or len(text) > 50):
+            replace_text_with_font(text_frame, new_content, CONTENTS_FONT_SIZE)
+            updated_elements += 1
+    
+    return updated_elements
+
 @mcp.tool()
 def duplicate_slide(slide_number: int = 1, new_title: str = "", new_content: str = "", new_chapter: str = "") -> str:
     """
@@ -493,59 +1188,29 @@ def duplicate_slide(slide_number: int = 1, new_title: str = "", new_content: str
         return "No presentation is currently open"
     
     try:
+        slides = current_presentation.slides
+        slide_count = len(slides)
+        
         # Select slide to duplicate (index starts from 0)
-        if slide_number < 1 or slide_number > len(current_presentation.slides):
-            return f"Invalid slide number. Must be between 1 and {len(current_presentation.slides)}"
+        if slide_number < 1 or slide_number > slide_count:
+            return f"Invalid slide number. Must be between 1 and {slide_count}"
         
-        source_slide = current_presentation.slides[slide_number - 1]
+        source_slide = slides[slide_number - 1]
         slide_layout = source_slide.slide_layout
-        new_slide = current_presentation.slides.add_slide(slide_layout)
+        new_slide = slides.add_slide(slide_layout)
+        slide_count += 1
         
         # Copy all shapes from source slide
-        for shape in source_slide.shapes:
-            try:
-                new_shape_element = deepcopy(shape.element)
-                new_slide.shapes._spTree.insert_element_before(
-                    new_shape_element, 'p:extLst'
-                )
-            except Exception as shape_error:
-                print(f"Warning: Could not copy shape: {shape_error}")
-                continue
+        try:
+            copy_shape_elements(source_slide.shapes._spTree.iter_shape_elms(), new_slide.shapes._spTree)
+        except Exception as shape_error:
+            print(f"Warning: Could not copy shapes: {shape_error}")
         
         # Update with new content
-        slide_count = len(current_presentation.slides)
         updated_elements = 0
         
         if new_title or new_content or new_chapter:
-            for shape in new_slide.shapes:
-                if not shape.has_text_frame:
-                    continue
-                    
-                text = shape.text.lower()
-                
-                # Update chapter
-                if new_chapter and ('chapter' in text or 'chap' in text):
-                    shape.text = new_chapter
-                    for paragraph in shape.text_frame.paragraphs:
-                        paragraph.font.name = "Pretendard"
-                        paragraph.font.size = Pt(18)
-                    updated_elements += 1
-                    
-                # Update title
-                elif new_title and ('title' in text or len(text) < 50):
-                    shape.text = new_title
-                    for paragraph in shape.text_frame.paragraphs:
-                        paragraph.font.name = "Pretendard"
-                        paragraph.font.size = Pt(24)
-                    updated_elements += 1
-                    
-                # Update content
-                elif new_content and ('content' in text or len(text) > 50):
-                    shape.text = new_content
-                    for paragraph in shape.text_frame.paragraphs:
-                        paragraph.font.name = "Pretendard"
-                        paragraph.font.size = Pt(14)
-                    updated_elements += 1
+            updated_elements = update_duplicated_slide_text(new_slide, new_title, new_content, new_chapter)
         
         return f"Successfully duplicated slide {slide_number} -> slide {slide_count}" + \
                (f" with {updated_elements} text elements updated" if new_title or new_content or new_chapter else "")
@@ -589,6 +1254,15 @@ def duplicate_and_update_slides(count: int = 4, slide_data: List[Dict] = None) -
     if not slide_data:
         slide_data = []
     
+    slides = current_presentation.slides
+    if len(slides) < 1:
+        return "Presentation has no slides to duplicate"
+    
+    # Walk the first slide once; every copy is cloned from the same shape elements
+    source_slide = slides[0]
+    slide_layout = source_slide.slide_layout
+    source_shapes = list(source_slide.shapes._spTree.iter_shape_elms())
+    
     results = []
     
     for i in range(count):
@@ -597,7 +1271,21 @@ def duplicate_and_update_slides(count: int = 4, slide_data: List[Dict] = None) -
         content = data.get('content', f'Content {i+2}')
         chapter = data.get('chapter', f'Chapter {i+2}')
         
-        result = duplicate_slide(1, title, content, chapter)
+        try:
+            new_slide = slides.add_slide(slide_layout)
+            
+            try:
+                copy_shape_elements(source_shapes, new_slide.shapes._spTree)
+            except Exception as shape_error:
+                print(f"Warning: Could not copy shapes: {shape_error}")
+            
+            result = f"Successfully duplicated slide 1 -> slide {len(slides)}"
+            if title or content or chapter:
+                updated_elements = update_duplicated_slide_text(new_slide, title, content, chapter)
+                result += f" with {updated_elements} text elements updated"
+        except Exception as e:
+            result = f"Error duplicating slide: {str(e)}"
+        
         results.append(f"Slide {i+2}: {result}")
     
     return "\n".join(results)
@@ -615,61 +1303,77 @@ def insert_table_from_data(slide_number: int, table_data: Dict, style: Dict) ->
         return "❌ No open presentation."
     
     try:
-        if slide_number > len(current_presentation.slides):
+        slides = current_presentation.slides
+        if slide_number > len(slides):
             return f"❌ Slide {slide_number} does not exist."
         
-        slide = current_presentation.slides[slide_number - 1]
+        return add_table_to_slide(slides[slide_number - 1], slide_number, table_data, style)
+        
+    except Exception as e:
+        return f"❌ Table insertion error: {str(e)}"
+
+def add_table_to_slide(slide, slide_number: int, table_data: Dict, style: Dict) -> str:
+    """Add a Notion table to an already resolved slide (slide_number is only used in messages)"""
+    try:
+        shapes = slide.shapes
         
         max_row = table_data['max_row']
         max_col = table_data['max_col']
         
         # Set table position and size
-        left = style.get('layout', {}).get('margin', Inches(1))
-        top = Inches(3.5)  # Below title and contents
-        width = Inches(8)
-        height = Inches(0.5) * max_row
+        left = style.get('layout', {}).get('margin', TABLE_DEFAULT_LEFT)
+        top = TABLE_TOP
+        width = TABLE_WIDTH
+        height = TABLE_ROW_HEIGHT * max_row
         
         # Add table
-        table_shape = slide.shapes.add_table(max_row, max_col, left, top, width, height)
+        table_shape = shapes.add_table(max_row, max_col, left, top, width, height)
         table = table_shape.table
         
-        # Organize data into 2D array
-        cell_matrix = [['' for _ in range(max_col)] for _ in range(max_row)]
-        header_matrix = [[False for _ in range(max_col)] for _ in range(max_row)]
-        
+        # Only the cells Notion supplied, the last entry for a cell winning;
+        # no full max_row x max_col buffers for sparse tables
+        supplied = {}
         for cell_data in table_data['cells']:
             row_idx = cell_data['row'] - 1
             col_idx = cell_data['col'] - 1
             if 0 <= row_idx < max_row and 0 <= col_idx < max_col:
-                cell_matrix[row_idx][col_idx] = cell_data['value']
-                header_matrix[row_idx][col_idx] = cell_data['is_header']
-        
-        # Input data and apply styles to table cells
-        for row_idx in range(max_row):
-            for col_idx in range(max_col):
-                cell = table.cell(row_idx, col_idx)
-                cell.text = cell_matrix[row_idx][col_idx]
+                supplied[(row_idx, col_idx)] = (cell_data['value'], bool(cell_data['is_header']))
+        
+        # Style values are the same for every cell
+        header_color = parse_notion_color(style['colors']['main'])
+        header_size = Pt(style['fonts']['caption']['size'])
+        body_size = Pt(style['fonts']['body']['size'])
+        
+        # Input data and apply styles; blank regular cells are left as add_table
+        # created them since there is no text or run to style
+        for (row_idx, col_idx), (value, is_header) in supplied.items():
+            if not value and not is_header:
+                continue
+            cell = table.cell(row_idx, col_idx)
+            cell.text = value
+            
+            if is_header:
+                # Header style
+                fill = cell.fill
+                fill.solid()
+                fill.fore_color.rgb = header_color
                 
-                if header_matrix[row_idx][col_idx]:
-                    # Header style
-                    fill = cell.fill
-                    fill.solid()
-                    fill.fore_color.rgb = parse_notion_color(style['colors']['main'])
-                    
-                    for paragraph in cell.text_frame.paragraphs:
-                        for run in paragraph.runs:
-                            run.font.color.rgb = RGBColor(255, 255, 255)
-                            run.font.bold = True
-                            run.font.size = Pt(style['fonts']['caption']['size'])
-                else:
-                    # Regular cell style
-                    for paragraph in cell.text_frame.paragraphs:
-                        for run in paragraph.runs:
-                            run.font.size = Pt(style['fonts']['body']['size'])
-                            run.font.color.rgb = RGBColor(0, 0, 0)
+                for paragraph in cell.text_frame.paragraphs:
+                    for run in paragraph.runs:
+                        font = run.font
+                        font.color.rgb = WHITE
+                        font.bold = True
+                        font.size = header_size
+            else:
+                # Regular cell style
+                for paragraph in cell.text_frame.paragraphs:
+                    for run in paragraph.runs:
+                        font = run.font
+                        font.size = body_size
+                        font.color.rgb = BLACK
         
         # Center align table
-        slide_width = slide.shapes[0].width if slide.shapes else Inches(10)
+        slide_width = shapes[0].width if shapes else DEFAULT_SLIDE_WIDTH
         table_shape.left = int((slide_width - table_shape.width) / 2)
         
         return f"✅ Added {max_row}x{max_col} table to slide {slide_number}"
@@ -693,25 +1397,21 @@ def apply_color_theme(color_palette: Dict[str, str]) -> str:
         
         for slide in current_presentation.slides:
             # Change title color
-            if hasattr(slide.shapes, 'title') and slide.shapes.title:
-                title_shape = slide.shapes.title
-                if title_shape.has_text_frame:
-                    for paragraph in title_shape.text_frame.paragraphs:
-                        for run in paragraph.runs:
-                            run.font.color.rgb = main_color
-                            run.font.bold = True
-                    theme_applied_count += 1
+            title_shape = slide.shapes.title
+            if title_shape is not None and title_shape.has_text_frame:
+                for paragraph in title_shape.text_frame.paragraphs:
+                    for run in paragraph.runs:
+                        font = run.font
+                        font.color.rgb = main_color
+                        font.bold = True
+                theme_applied_count += 1
             
-            # Apply accent color to Chapter text
-            for shape in slide.shapes:
-                if hasattr(shape, 'text_frame') and shape.has_text_frame:
-                    text = shape.text_frame.text
-                    if 'Chapter' in text:
-                        for paragraph in shape.text_frame.paragraphs:
-                            for run in paragraph.runs:
-                                if 'Chapter' in run.text:
-                                    run.font.color.rgb = accent_color
-                                    run.font.bold = True
+            # Apply accent color to Chapter text; the XPath selects the matching
+            # runs directly instead of walking every shape, paragraph and run
+            for r in slide.element.xpath(_CHAPTER_RUNS_XPATH):
+                font = _Run(r, None).font
+                font.color.rgb = accent_color
+                font.bold = True
         
         return f"✅ Color theme applied ({theme_applied_count} slides, Main: {color_palette['main']}, Accent: {color_palette['accent']})"
         
@@ -738,8 +1438,15 @@ def auto_generate_from_notion_url(notion_url: str) -> str:
         
         results.append(f"📋 Basic settings extracted: {basic_settings.get('project_name', 'Unknown')}")
         
+        # Both database queries only need the page already fetched above,
+        # so run them in the background while the presentation is built
+        executor = ThreadPoolExecutor(max_workers=2)
+        slide_configs_future = executor.submit(extract_slide_configurations_from_content, page_content)
+        table_data_future = executor.submit(extract_table_data_from_content, page_content)
+        executor.shutdown(wait=False)
+        
         # 2. Extract style guide
-        style_guide = extract_style_guide(notion_url)
+        style_guide = extract_style_guide_from_content(page_content)
         results.append(f"🎨 Style guide extracted")
         
         # 3. Create presentation
@@ -752,7 +1459,7 @@ def auto_generate_from_notion_url(notion_url: str) -> str:
         results.append(create_result)
         
         # 4. Extract and generate slide configuration data
-        slide_configs = extract_slide_configurations(notion_url)
+        slide_configs = slide_configs_future.result()
         if slide_configs:
             for i, config in enumerate(slide_configs):
                 if i == 0:
@@ -776,13 +1483,18 @@ def auto_generate_from_notion_url(notion_url: str) -> str:
             results.append("⚠️ No slide configuration data found.")
         
         # 5. Process table data
-        table_data_raw = extract_table_data(notion_url)
+        table_data_raw = table_data_future.result()
         if table_data_raw:
             tables_organized = organize_table_data(table_data_raw)
             
+            # Resolve the slide list once for all tables instead of once per table
+            slides_list = list(current_presentation.slides)
             for table_key, table_info in tables_organized.items():
                 slide_num = int(table_info['slide_number'])
-                table_result = insert_table_from_data(slide_num, table_info, style_guide)
+                if slide_num > len(slides_list):
+                    results.append(f"❌ Slide {slide_num} does not exist.")
+                    continue
+                table_result = add_table_to_slide(slides_list[slide_num - 1], slide_num, table_info, style_guide)
                 results.append(table_result)
         else:
             results.append("ℹ️ No table data found.")
@@ -797,15 +1509,12 @@ def auto_generate_from_notion_url(notion_url: str) -> str:
         results.append(save_result)
         
         # 8. Summarize results
-        success_msg = f"""
-🎉 Notion-based PPT auto-generation completed!
-📊 Processing results:
-{chr(10).join(f"  {result}" for result in results)}
-📁 URL: {notion_url}
-💾 Saved: {filename}.pptx
-        """
+        lines = ["🎉 Notion-based PPT auto-generation completed!", "📊 Processing results:"]
+        lines.extend(f"  {result}" for result in results)
+        lines.append(f"📁 URL: {notion_url}")
+        lines.append(f"💾 Saved: {filename}.pptx")
         
-        return success_msg.strip()
+        return "\n".join(lines)
         
     except Exception as e:
         return f"❌ Auto-generation error: {str(e)}"
@@ -822,11 +1531,10 @@ def clone_template_and_update(template_name: str, chapter: str = "", title: str
     """
     global current_presentation, current_filename
     
-    if not template_registry:
-        discover_templates()
+    _ensure_templates()
     
     if template_name not in template_registry:
-        available = ", ".join(template_registry.keys()) if template_registry else "None"
+        available = available_templates_text
         return f"Template '{template_name}' not found.\nAvailable templates: {available}"
     
     try:
@@ -846,7 +1554,7 @@ def clone_template_and_update(template_name: str, chapter: str = "", title: str
         
         # 3. Set filename
         if new_filename:
-            current_filename = new_filename if new_filename.endswith('.pptx') else f"{new_filename}.pptx"
+            current_filename = ensure_pptx_suffix(new_filename)
         else:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             current_filename = f"{template_name}_updated_{timestamp}.pptx"
@@ -855,19 +1563,102 @@ def clone_template_and_update(template_name: str, chapter: str = "", title: str
         
         return f"""Template cloned and updated successfully!
 Template: {template_name}
-Source: {template_info['location']}
+Source: {template_info.location}
 Modified elements: {update_result['modified_count']}
 Total slides: {len(current_presentation.slides)}
 Updated content:
    Chapter: {chapter if chapter else '(unchanged)'}
    Title: {title if title else '(unchanged)'}
-   Contents: {contents[:50] + '...' if len(contents) > 50 else contents if contents else '(unchanged)'}
+   Contents: {contents_preview(contents)}
 Ready to save as: {current_filename}
 Use 'save_presentation()' to save the updated presentation!"""
         
     except Exception as e:
         return f"Error cloning and updating template: {str(e)}"
 
+@mcp.tool()
+def fast_clone_template(template_name: str, chapter: str = "", title: str = "", 
+                        contents: str = "", new_filename: str = "") -> str:
+    """
+    Clone template and update chapter, title, contents directly on disk
+    
+    Faster than clone_template_and_update for large templates because only the
+    slides that change are parsed. The result is saved straight to the save
+    directory and is not opened as the current presentation.
+    """
+    _ensure_templates()
+    
+    if template_name not in template_registry:
+        available = available_templates_text
+        return f"Template '{template_name}' not found.\nAvailable templates: {available}"
+    
+    try:
+        # One timestamp for the filename and backup name
+        now = datetime.datetime.now()
+        
+        if new_filename:
+            filename = ensure_pptx_suffix(new_filename)
+        else:
+            filename = f"{template_name}_updated_{now.strftime('%Y%m%d_%H%M%S')}.pptx"
+        
+        save_path = PRESENTATIONS_DIR / filename
+        if save_path.exists():
+            backup_name = f"{save_path.stem}_backup_{now.strftime('%H%M%S')}.pptx"
+            backup_file_fast(save_path, PRESENTATIONS_DIR / backup_name)
+        
+        template_info = template_registry[template_name]
+        result = fast_clone_and_update(template_info.path, save_path, chapter, title, contents)
+        
+        if result["status"] != "success":
+            return f"Failed to clone template: {result['error_message']}"
+        
+        return f"""Template cloned and saved successfully!
+Template: {template_name}
+Source: {template_info.location}
+Modified slides: {result['modified_count']}
+Total slides: {result['slide_count']}
+Saved to: {save_path}"""
+        
+    except Exception as e:
+        return f"Error cloning template: {str(e)}"
+
+def apply_slide_text_updates(slide, chapter: str, title: str, contents: str) -> int:
+    """
+    Replace chapter/title/contents text on one slide in a single shape pass
+    
+    Returns:
+        Number of text frames that were changed
+    """
+    modified_count = 0
+    updates = {
+        'chapter': (chapter, CHAPTER_FONT_SIZE),
+        'title': (title, TITLE_FONT_SIZE),
+        'contents': (contents, CONTENTS_FONT_SIZE)
+    }
+    # Only roles with new text take part in matching
+    active_roles = tuple(role for role in _ROLE_PRIORITY if updates[role][0])
+    
+    for shape in slide.shapes:
+        if not shape.has_text_frame:
+            continue
+        text_frame = shape.text_frame
+        current_text = text_frame.text
+        role = classify_text_role(current_text, active_roles)
+        if role is None:
+            continue
+        
+        new_text, font_size = updates[role]
+        if current_text == new_text:
+            # Already up to date; don't rebuild the runs
+            continue
+        replace_text_with_font(text_frame, new_text, font_size)
+        modified_count += 1
+    
+    if modified_count:
+        slide_title_cache(current_presentation).pop(slide.part, None)
+    
+    return modified_count
+
 @mcp.tool()
 def update_specific_slide_text(slide_number: int, chapter: str = "", title: str = "", 
                               contents: str = "") -> str:
@@ -879,62 +1670,86 @@ def update_specific_slide_text(slide_number: int, chapter: str = "", title: str
     if current_presentation is None:
         return "No presentation open. Please create or load a presentation first."
     
-    if slide_number < 1 or slide_number > len(current_presentation.slides):
-        return f"Invalid slide number. Presentation has {len(current_presentation.slides)} slides."
+    slides = current_presentation.slides
+    slide_count = len(slides)
+    if slide_number < 1 or slide_number > slide_count:
+        return f"Invalid slide number. Presentation has {slide_count} slides."
+    
+    if not (chapter or title or contents):
+        return f"No updates requested for slide {slide_number}."
     
     try:
-        slide = current_presentation.slides[slide_number - 1]
-        modified_count = 0
-        
-        for shape in slide.shapes:
-            if not shape.has_text_frame:
-                continue
-            text = shape.text_frame.text.strip().lower()
-            
-            # Chapter text update
-            if any(keyword in text for keyword in ['chapter', 'chap']) and chapter:
-                shape.text_frame.text = chapter
-                for paragraph in shape.text_frame.paragraphs:
-                    paragraph.font.name = "Pretendard"
-                    paragraph.font.size = Pt(18)
-                modified_count += 1
-            
-            # Title text update
-            elif any(keyword in text for keyword in ['title']) and title:
-                shape.text_frame.text = title
-                for paragraph in shape.text_frame.paragraphs:
-                    paragraph.font.name = "Pretendard"
-                    paragraph.font.size = Pt(24)
-                modified_count += 1
-                
-            # Contents text update
-            elif any(keyword in text for keyword in ['contents', 'content']) and contents:
-                shape.text_frame.text = contents
-                for paragraph in shape.text_frame.paragraphs:
-                    paragraph.font.name = "Pretendard"
-                    paragraph.font.size = Pt(14)
-                modified_count += 1
+        modified_count = apply_slide_text_updates(slides[slide_number - 1], chapter, title, contents)
         
         return f"""Slide {slide_number} updated successfully!
 Modified elements: {modified_count}
 Updated content:
    Chapter: {chapter if chapter else '(unchanged)'}
    Title: {title if title else '(unchanged)'}
-   Contents: {contents[:50] + '...' if len(contents) > 50 else contents if contents else '(unchanged)'}"""
+   Contents: {contents_preview(contents)}"""
         
     except Exception as e:
         return f"Error updating slide {slide_number}: {str(e)}"
 
+@mcp.tool()
+def batch_update_slides(updates: List[Dict]) -> str:
+    """
+    Update text on several slides in one call
+    
+    Args:
+        updates: [{"slide_number": 1, "chapter": "", "title": "", "contents": ""}, ...]
+    
+    Returns:
+        Per-slide update summary
+    """
+    global current_presentation
+    
+    if current_presentation is None:
+        return "No presentation open. Please create or load a presentation first."
+    
+    if not updates:
+        return "No updates requested."
+    
+    slides = current_presentation.slides
+    slide_count = len(slides)
+    results = []
+    total_modified = 0
+    
+    for update in updates:
+        get = update.get
+        slide_number = get('slide_number')
+        if not isinstance(slide_number, int) or slide_number < 1 or slide_number > slide_count:
+            results.append(f"   Slide {slide_number}: skipped (invalid slide number)")
+            continue
+        
+        chapter, title, contents = get('chapter', ''), get('title', ''), get('contents', '')
+        if not (chapter or title or contents):
+            results.append(f"   Slide {slide_number}: skipped (no updates)")
+            continue
+        
+        try:
+            modified_count = apply_slide_text_updates(slides[slide_number - 1], chapter, title, contents)
+        except Exception as e:
+            results.append(f"   Slide {slide_number}: error ({str(e)})")
+            continue
+        total_modified += modified_count
+        results.append(f"   Slide {slide_number}: {modified_count} elements modified")
+    
+    results_text = "\n".join(results)
+    return f"""Batch update complete!
+Slides requested: {len(updates)}
+Modified elements: {total_modified}
+{results_text}"""
+
 @mcp.tool()
 def create_presentation_from_template(template_name: str, presentation_title: str = "New Presentation") -> str:
     """Create a new presentation from a template"""
     global current_presentation, current_filename
     
-    if not template_registry:
-        discover_templates()
+    _ensure_templates()
     
     if template_name not in template_registry:
-        available = ", ".join(template_registry.keys()) if template_registry else "None"
+        available = available_templates_text
         return f"Template '{template_name}' not found.\nAvailable templates: {available}"
     
     try:
@@ -955,7 +1770,7 @@ def create_presentation_from_template(template_name: str, presentation_title: st
         
         return f"""Presentation created from template!
 Template: {template_name}
-Source: {template_info['location']}
+Source: {template_info.location}
 Title: {presentation_title}
 Initial slides: {len(current_presentation.slides)}"""
         
@@ -975,67 +1790,117 @@ def save_presentation(filename: Optional[str] = None, auto_save: bool = True) ->
         return "No presentation to save."
     
     try:
+        # One timestamp for the filename, backup name and metadata
+        now = datetime.datetime.now()
+        
         if filename is None:
             if current_filename:
                 filename = current_filename
             else:
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"presentation_{timestamp}.pptx"
+                filename = f"presentation_{now.strftime('%Y%m%d_%H%M%S')}.pptx"
         
-        if not filename.endswith('.pptx'):
-            filename += '.pptx'
+        filename = ensure_pptx_suffix(filename)
         
         save_path = PRESENTATIONS_DIR / filename
         
+        # The backup only has to finish before the old file is replaced,
+        # so it runs while the new version is written
+        backup_future = None
         if save_path.exists():
-            backup_name = f"{save_path.stem}_backup_{datetime.datetime.now().strftime('%H%M%S')}.pptx"
+            backup_name = f"{save_path.stem}_backup_{now.strftime('%H%M%S')}.pptx"
             backup_path = PRESENTATIONS_DIR / backup_name
-            shutil.copy2(save_path, backup_path)
-        
-        current_presentation.save(str(save_path))
+            backup_future = _io_executor.submit(backup_file_fast, save_path, backup_path)
+        
+        # Write to a temporary file and swap it in, leaving any backup link intact
+        temp_path = save_path.with_name(f".{save_path.name}.tmp")
+        try:
+            # Large buffer so the zip writer's many small writes coalesce
+            with open(temp_path, 'wb', buffering=COPY_BUFFER_SIZE) as f:
+                current_presentation.save(f)
+                saved_size = f.tell()
+            if backup_future is not None:
+                backup_future.result()
+            os.replace(temp_path, save_path)
+        except BaseException:
+            # After a successful os.replace there is nothing left to clean up
+            temp_path.unlink(missing_ok=True)
+            raise
         current_filename = filename
         
         save_info = {
             "filename": filename,
             "path": str(save_path),
-            "size": save_path.stat().st_size,
-            "saved_at": datetime.datetime.now().isoformat(),
+            "size": saved_size,
+            "saved_at": now.isoformat(),
             "slide_count": len(current_presentation.slides)
         }
         
         if auto_save:
             meta_path = PRESENTATIONS_DIR / f"{save_path.stem}_meta.json"
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                json.dump(save_info, f, indent=2, ensure_ascii=False)
+            _io_executor.submit(write_json_file, save_info, meta_path).add_done_callback(_log_background_error)
         
         return f"""Presentation saved successfully!
 Filename: {filename}
 Path: {save_path}
 Size: {save_info['size']:,} bytes
 Slides: {save_info['slide_count']}
-Saved at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
+Saved at: {now.strftime('%Y-%m-%d %H:%M:%S')}"""
         
     except Exception as e:
         return f"Save error: {str(e)}"
 
 @mcp.tool()
-def get_presentation_info() -> str:
-    """Get current presentation information"""
+def export_presentation_bytes() -> str:
+    """
+    Export the current presentation as base64-encoded .pptx data
+    
+    Alternative to save_presentation when the caller only needs the file
+    contents; nothing is written to the save directory.
+    """
+    global current_presentation
+    
+    if current_presentation is None:
+        return "No presentation to export."
+    
+    try:
+        buffer = BytesIO()
+        current_presentation.save(buffer)
+        return base64.b64encode(buffer.getbuffer()).decode('ascii')
+    except Exception as e:
+        return f"Export error: {str(e)}"
+
+@mcp.tool()
+def get_presentation_info(max_titles: int = 100) -> str:
+    """
+    Get current presentation information
+    
+    Args:
+        max_titles: Maximum number of slide titles to list
+    """
     global current_presentation, current_filename
     
     if current_presentation is None:
         return "No presentation open."
     
     try:
-        slide_count = len(current_presentation.slides)
+        slides = current_presentation.slides
+        slide_count = len(slides)
         filename = current_filename or "Not saved"
         
+        # Titles are only re-read for slides that are new or were edited since the last call
+        titles = slide_title_cache(current_presentation)
         slide_titles = []
-        for i, slide in enumerate(current_presentation.slides, 1):
-            title = "No title"
-            if slide.shapes.title and slide.shapes.title.text:
-                title = slide.shapes.title.text[:50]
+        for i, slide in enumerate(islice(slides, max(max_titles, 0)), 1):
+            title = titles.get(slide.part)
+            if title is None:
+                # Read the title body straight from the XML instead of building every shape proxy
+                title_bodies = slide.element.xpath(_SLIDE_TITLE_BODY_XPATH)
+                title_text = TextFrame(title_bodies[0], None).text if title_bodies else ""
+                title = title_text[:50] if title_text else "No title"
+                titles[slide.part] = title
             slide_titles.append(f"  {i}. {title}")
+        if slide_count > len(slide_titles):
+            slide_titles.append(f"  ... and {slide_count - len(slide_titles)} more")
         
         return f"""Current presentation info:
 Filename: {filename}
@@ -1048,29 +1913,50 @@ Slide list:
     except Exception as e:
         return f"Info error: {str(e)}"
 
+def _saved_presentation_entries() -> List[tuple]:
+    """(name, size, mtime) of saved presentations, newest first, cached on the directory mtime"""
+    global _saved_listing_cache
+    
+    dir_mtime = os.stat(PRESENTATIONS_DIR).st_mtime_ns
+    if _saved_listing_cache is not None and _saved_listing_cache[0] == dir_mtime:
+        return _saved_listing_cache[1]
+    
+    # DirEntry caches its stat result, so each file is stat'ed once
+    files = []
+    with os.scandir(PRESENTATIONS_DIR) as entries:
+        for entry in entries:
+            name = entry.name
+            # Match glob("*.pptx"): case-insensitive on Windows, dotfiles excluded
+            if not name.startswith('.') and name.lower().endswith('.pptx') and entry.is_file():
+                stat = entry.stat()
+                files.append((name, stat.st_size, stat.st_mtime))
+    files.sort(key=lambda item: item[2], reverse=True)
+    
+    # Saves land via os.replace, which bumps the directory mtime
+    _saved_listing_cache = (dir_mtime, files)
+    return files
+
 @mcp.tool()
 def list_saved_presentations() -> str:
     """List all saved presentations"""
     try:
-        pptx_files = list(PRESENTATIONS_DIR.glob("*.pptx"))
+        pptx_files = _saved_presentation_entries()
         
         if not pptx_files:
             return f"No saved presentations found.\nSave path: {PRESENTATIONS_DIR}"
         
-        file_list = []
-        for file_path in sorted(pptx_files, key=lambda x: x.stat().st_mtime, reverse=True):
-            stat = file_path.stat()
-            size_mb = stat.st_size / (1024 * 1024)
-            modified = datetime.datetime.fromtimestamp(stat.st_mtime)
-            
-            file_list.append(f"{file_path.name}")
-            file_list.append(f"   Size: {size_mb:.1f}MB")
-            file_list.append(f"   Modified: {modified.strftime('%Y-%m-%d %H:%M:%S')}")
-            file_list.append("")
+        fromtimestamp = datetime.datetime.fromtimestamp
+        # One formatted block per file, followed by a blank line
+        file_list = "\n".join(
+            f"{name}\n"
+            f"   Size: {size / (1024 * 1024):.1f}MB\n"
+            f"   Modified: {fromtimestamp(mtime):%Y-%m-%d %H:%M:%S}\n"
+            for name, size, mtime in pptx_files
+        )
         
         return f"""Saved presentations ({len(pptx_files)} files)
 Save path: {PRESENTATIONS_DIR}
-{chr(10).join(file_list)}"""
+{file_list}"""
         
     except Exception as e:
         return f"Error listing files: {str(e)}"
@@ -1103,8 +1989,7 @@ def add_slide(title: str = "", content: str = "", layout_index: int = 1) -> str:
         return "No presentation open. Please create a presentation first."
     
     try:
-        slide_layout = current_presentation.slide_layouts[layout_index]
-        slide = current_presentation.slides.add_slide(slide_layout)
+        slide = current_presentation.slides.add_slide(slide_layout(current_presentation, layout_index))
         
         if title and slide.shapes.title:
             slide.shapes.title.text = title
@@ -1121,46 +2006,44 @@ def add_slide(title: str = "", content: str = "", layout_index: int = 1) -> str:
 # NOTION HELPER TOOLS
 # ═══════════════════════════════════════════════════════════════════
 
+# Sections validate_notion_structure looks for: (label, English heading, Korean heading)
+_NOTION_STRUCTURE_CHECKS = (
+    ('Basic Settings', 'Basic Settings', '기본 설정'),
+    ('Slide Configuration', 'Slide Configuration', '슬라이드 구성'),
+    ('Style Guide', 'Style Guide', '스타일 가이드'),
+    ('Table Data', 'Table Data', '표 데이터'),
+    ('Diagram Elements', 'Diagram Elements', '다이어그램 요소')
+)
+# All headings in one alternation; the group name (s0..s4) is the check's index
+_NOTION_STRUCTURE_RE = re.compile('|'.join(
+    f'(?P<s{i}>{re.escape(english)}|{re.escape(korean)})'
+    for i, (_, english, korean) in enumerate(_NOTION_STRUCTURE_CHECKS)
+))
+
 @mcp.tool()
 def validate_notion_structure(notion_url: str) -> str:
     """Validate Notion page structure"""
-    validation = {
-        'basic_settings': False,
-        'slide_config': False,
-        'style_guide': False,
-        'has_tables': False,
-        'has_diagrams': False
-    }
-    
     try:
         page_content = fetch_notion_page(notion_url)
-        if page_content:
-            content_text = page_content.get('text', '')
-            
-            # Support both Korean and English
-            validation['basic_settings'] = ('Basic Settings' in content_text or '기본 설정' in content_text)
-            validation['slide_config'] = ('Slide Configuration' in content_text or '슬라이드 구성' in content_text)
-            validation['style_guide'] = ('Style Guide' in content_text or '스타일 가이드' in content_text)
-            validation['has_tables'] = ('Table Data' in content_text or '표 데이터' in content_text)
-            validation['has_diagrams'] = ('Diagram Elements' in content_text or '다이어그램 요소' in content_text)
-            
+        content_text = page_content.get('text', '') if page_content else ''
+        
+        # Support both Korean and English; one scan that stops once every section is seen
+        found = set()
+        for match in _NOTION_STRUCTURE_RE.finditer(content_text):
+            found.add(match.lastgroup)
+            if len(found) == len(_NOTION_STRUCTURE_CHECKS):
+                break
+        checks = [
+            (label, f's{i}' in found)
+            for i, (label, _, _) in enumerate(_NOTION_STRUCTURE_CHECKS)
+        ]
+        
         # Format results
         result_lines = ["📋 Notion page structure validation results:"]
+        result_lines.extend(f"  {'✅' if present else '❌'} {label}" for label, present in checks)
         
-        for key, value in validation.items():
-            status = "✅" if value else "❌"
-            readable_key = {
-                'basic_settings': 'Basic Settings',
-                'slide_config': 'Slide Configuration',
-                'style_guide': 'Style Guide',
-                'has_tables': 'Table Data',
-                'has_diagrams': 'Diagram Elements'
-            }.get(key, key)
-            
-            result_lines.append(f"  {status} {readable_key}")
-        
-        valid_count = sum(validation.values())
-        result_lines.append(f"\n📊 Valid sections: {valid_count}/5")
+        valid_count = sum(present for _, present in checks)
+        result_lines.append(f"\n📊 Valid sections: {valid_count}/{len(checks)}")
         
         if valid_count >= 3:
             result_lines.append("🎉 PPT auto-generation possible!")
@@ -1176,10 +2059,9 @@ def validate_notion_structure(notion_url: str) -> str:
 def get_slide_config_by_number(notion_url: str, slide_number: int) -> str:
     """Get configuration information for specific slide number"""
     try:
-        slide_configs = extract_slide_configurations(notion_url)
-        for config in slide_configs:
-            if int(config.get('Slide', 0)) == slide_number:
-                return f"""Slide {slide_number} configuration info:
+        config = slide_config_index(notion_url).get(slide_number)
+        if config is not None:
+            return f"""Slide {slide_number} configuration info:
                 
 Chapter: {config.get('Chapter', 'N/A')}
 Title: {config.get('Title', 'N/A')}
@@ -1196,8 +2078,7 @@ Special Requirements: {config.get('Special_Requirements', 'N/A')}"""
 def get_table_data_by_slide(notion_url: str, slide_number: int) -> str:
     """Get table data for specific slide"""
     try:
-        table_data = extract_table_data(notion_url)
-        slide_tables = [item for item in table_data if item.get('Parent_Slide') == str(slide_number)]
+        slide_tables = table_data_index(notion_url).get(str(slide_number), [])
         
         if not slide_tables:
             return f"❌ No table data found for slide {slide_number}."
@@ -1223,18 +2104,11 @@ def get_table_data_by_slide(notion_url: str, slide_number: int) -> str:
     except Exception as e:
         return f"❌ Table data query error: {str(e)}"
 
-# Initialize template discovery on startup
-try:
-    discover_templates()
-    print(f"Template discovery completed: {len(template_registry)} templates found")
-except Exception as e:
-    print(f"Template discovery error: {e}")
-
 if __name__ == "__main__":
     print(f"Enhanced PowerPoint MCP Server starting...")
     print(f"Save directory: {PRESENTATIONS_DIR}")
     print(f"Temp directory: {TEMP_DIR}")
-    print(f"Template registry: {len(template_registry)} templates found")
+    print("Template registry: discovered on first template tool call")
     
     try:
         mcp.run()